@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING, Any, Callable, Literal, Optional
 import pathvalidate
 
 if TYPE_CHECKING:
+    from jsonschema.protocols import Validator
     from jsonschema_diff import JsonSchemaDiff
 
 import pytest
@@ -27,7 +28,9 @@ from genschema.postprocessing import (
     SchemaReferenceExtractionConfig,
     SchemaReferencePostprocessor,
 )
-from jsonschema import FormatChecker, ValidationError, validate
+from jsonschema import FormatChecker, ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 
 from .stats import GLOBAL_STATS
 from .tools import NameMaker
@@ -68,13 +71,22 @@ class SchemaShot:
         self.save_original: bool = save_original
         self.debug_mode: bool = debug_mode
         self.snapshot_dir: Path = root_dir / snapshot_dir_name
+        self.ci_cd_dir: Path = self.snapshot_dir / "ci.cd"
         self.used_schemas: set[str] = set()
+        self._valid_names: set[str] = set()  # names already accepted by pathvalidate
+        # snapshot path -> (snapshot text, checked validator); one entry per snapshot file
+        self._validators: dict[Path, tuple[str, "Validator"]] = {}
 
         if self.format_mode not in {"on", "safe", "off"}:
             raise ValueError(
                 "Invalid jsss_format_mode value. Expected one of: 'on', 'safe', 'off'."
             )
 
+        # FormatChecker is stateless, so one instance serves every validation
+        self.format_checker: Optional[FormatChecker] = (
+            FormatChecker() if self._is_format_validation_enabled() else None
+        )
+
         self.conv = Converter(
             pseudo_handler=PseudoArrayHandler(),
             base_of="anyOf",
@@ -94,10 +106,12 @@ class SchemaShot:
         )
 
         self.logger = logging.getLogger(__name__)
-        # добавляем вывод в stderr
-        handler = logging.StreamHandler()
-        handler.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
-        self.logger.addHandler(handler)
+        # добавляем вывод в stderr (один раз: логгер общий для всех экземпляров,
+        # иначе каждое сообщение печаталось бы по разу на каждую директорию)
+        if not self.logger.handlers:
+            handler = logging.StreamHandler()
+            handler.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+            self.logger.addHandler(handler)
         # и поднимаем уровень, чтобы INFO/DEBUG прошли через handler
         self.logger.setLevel(logging.INFO)
 
@@ -105,9 +119,8 @@ class SchemaShot:
         # causes avoidable races under pytest-xdist.
         self.snapshot_dir.mkdir(parents=True, exist_ok=True)
         if self.ci_cd_mode:
-            cicd = self.snapshot_dir / "ci.cd"
-            shutil.rmtree(cicd, ignore_errors=True)
-            cicd.mkdir(parents=True, exist_ok=True)
+            shutil.rmtree(self.ci_cd_dir, ignore_errors=True)
+            self.ci_cd_dir.mkdir(parents=True, exist_ok=True)
 
     def _is_format_annotation_enabled(self) -> bool:
         return self.format_mode in {"on", "safe"}
@@ -133,11 +146,35 @@ class SchemaShot:
     def _finalize_generated_schema(self, schema: dict[str, Any]) -> dict[str, Any]:
         return SchemaReferencePostprocessor.process(schema, self.reference_extraction_config)
 
-    def _validate_instance(self, instance: Any, schema: dict[str, Any]) -> None:
-        validate_kwargs: dict[str, Any] = {}
-        if self._is_format_validation_enabled():
-            validate_kwargs["format_checker"] = FormatChecker()
-        validate(instance=instance, schema=schema, **validate_kwargs)
+    @staticmethod
+    def _write_json(path: Path, data: Any) -> None:
+        """Serializes data in memory and writes it to path in a single call."""
+        # json.dump with indent streams every token through f.write separately
+        path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    def _get_validator(self, path: Path, text: str, schema: dict[str, Any]) -> "Validator":
+        """
+        Returns a checked validator for the snapshot at path, built from its parsed schema.
+
+        jsonschema.validate re-checks the schema against its meta-schema on every call;
+        here that happens once per snapshot version. The cached validator is reused only
+        while the snapshot text is unchanged.
+        """
+        cached = self._validators.get(path)
+        if cached is not None and cached[0] == text:
+            return cached[1]
+        validator_cls = validator_for(schema)
+        validator_cls.check_schema(schema)
+        validator = validator_cls(schema, format_checker=self.format_checker)
+        self._validators[path] = (text, validator)
+        return validator
+
+    def _validate_instance(
+        self, instance: Any, path: Path, text: str, schema: dict[str, Any]
+    ) -> None:
+        error = best_match(self._get_validator(path, text, schema).iter_errors(instance))
+        if error is not None:
+            raise error
 
     def _process_name(self, name: str | int | Callable | list[str | int | Callable]) -> str:
         """
@@ -153,6 +190,8 @@ class SchemaShot:
         __tracebackhide__ = not self.debug_mode  # прячем из стека pytest
 
         def process_name_part(part: str | int | Callable) -> str:
+            if type(part) is str:
+                return part
             if callable(part):
                 return NameMaker.format(part, self.callable_regex)
             else:
@@ -166,6 +205,9 @@ class SchemaShot:
         if not isinstance(name, str) or not name:
             raise ValueError("Schema name must be a non-empty string")
 
+        if name in self._valid_names:
+            return name
+
         try:
             # auto подберёт правила под текущую ОС
             pathvalidate.validate_filename(
@@ -174,6 +216,7 @@ class SchemaShot:
         except pathvalidate.ValidationError as e:
             raise ValueError(f"Invalid schema name: {e}") from None
 
+        self._valid_names.add(name)
         return name
 
     def _save_process_original(self, real_name: str, status: Optional[bool], data: dict) -> None:
@@ -185,8 +228,8 @@ class SchemaShot:
             json_path = base_j_path
             schema_path = base_s_path
         else:
-            json_path = self.snapshot_dir / "ci.cd" / json_name
-            schema_path = self.snapshot_dir / "ci.cd" / schema_name
+            json_path = self.ci_cd_dir / json_name
+            schema_path = self.ci_cd_dir / schema_name
 
         if self.save_original:
             available_to_create = (
@@ -199,8 +242,7 @@ class SchemaShot:
             if (available_to_create and self.update_actions.get("add")) or (
                 available_to_update and self.update_actions.get("update")
             ):
-                with open(json_path, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                self._write_json(json_path, data)
 
                 if available_to_create:
                     GLOBAL_STATS.add_created(json_name)
@@ -279,14 +321,13 @@ class SchemaShot:
         """
         __tracebackhide__ = not self.debug_mode  # прячем из стека pytest
 
-        # Проверка имени
-        name = self._process_name(name)
-
-        base_path = self.snapshot_dir / f"{name}.schema.json"
+        # name уже прошёл _process_name в assert_*_match
+        schema_name = f"{name}.schema.json"
+        base_path = self.snapshot_dir / schema_name
         if not self.ci_cd_mode:
             schema_path = base_path
         else:
-            schema_path = self.snapshot_dir / "ci.cd" / f"{name}.schema.json"
+            schema_path = self.ci_cd_dir / schema_name
         self.used_schemas.add(schema_path.name)
 
         # --- состояние ДО проверки ---
@@ -316,15 +357,14 @@ class SchemaShot:
 
             current_schema = make_schema(current_data, type_data)
 
-            with open(schema_path, "w", encoding="utf-8") as f:
-                json.dump(current_schema, f, indent=2, ensure_ascii=False)
+            self._write_json(schema_path, current_schema)
 
-            self.logger.info(f"New schema `{name}` has been created.")
+            self.logger.info("New schema `%s` has been created.", name)
             GLOBAL_STATS.add_created(schema_path.name)  # статистика «создана»
             return name, None
         else:
-            with open(base_path, "r", encoding="utf-8") as f:
-                existing_schema = json.load(f)
+            existing_text = base_path.read_text(encoding="utf-8")
+            existing_schema = json.loads(existing_text)
 
             # --- схема уже была: сравнение и валидация --------------------------------
             schema_updated = False
@@ -357,26 +397,24 @@ class SchemaShot:
 
                         if existing_schema != current_schema:
                             differences = self.differ.compare(
-                                dict(existing_schema), current_schema
+                                existing_schema, current_schema
                             ).render()
                             GLOBAL_STATS.add_updated(schema_path.name, differences)
 
-                            with open(schema_path, "w", encoding="utf-8") as f:
-                                json.dump(current_schema, f, indent=2, ensure_ascii=False)
-                            self.logger.warning(f"Schema `{name}` reseted.\n\n{differences}")
+                            self._write_json(schema_path, current_schema)
+                            self.logger.warning("Schema `%s` reseted.\n\n%s", name, differences)
                     elif self.update_mode or self.ci_cd_mode and not self.reset_mode:
                         merged_schema = merge_schemas(existing_schema, current_data, type_data)
 
                         if existing_schema != merged_schema:
                             differences = self.differ.compare(
-                                dict(existing_schema), merged_schema
+                                existing_schema, merged_schema
                             ).render()
                             GLOBAL_STATS.add_updated(schema_path.name, differences)
 
-                            with open(schema_path, "w", encoding="utf-8") as f:
-                                json.dump(merged_schema, f, indent=2, ensure_ascii=False)
+                            self._write_json(schema_path, merged_schema)
 
-                            self.logger.warning(f"Schema `{name}` updated.\n\n{differences}")
+                            self.logger.warning("Schema `%s` updated.\n\n%s", name, differences)
                     else:  # both update_mode and reset_mode are True
                         raise ValueError(
                             "update_mode, ci_cd_mode and reset_mode"
@@ -388,14 +426,12 @@ class SchemaShot:
 
                     differences = ""
                     if existing_schema != merged_schema:
-                        differences = self.differ.compare(
-                            dict(existing_schema), merged_schema
-                        ).render()
+                        differences = self.differ.compare(existing_schema, merged_schema).render()
                         GLOBAL_STATS.add_uncommitted(schema_path.name, differences)
 
                     # только валидируем по старой схеме
                     try:
-                        self._validate_instance(instance=data, schema=existing_schema)
+                        self._validate_instance(data, base_path, existing_text, existing_schema)
                     except ValidationError as e:
                         pytest.fail(
                             f"\n\n{differences}\n\nValidation error in `{name}`: {e.message}"
@@ -403,15 +439,13 @@ class SchemaShot:
             elif data is not None and type_data == "schema":
                 # схемы совпали – всё равно валидируем на случай формальных ошибок
                 try:
-                    self._validate_instance(instance=data, schema=existing_schema)
+                    self._validate_instance(data, base_path, existing_text, existing_schema)
                 except ValidationError as e:
                     merged_schema = merge_schemas(existing_schema, current_data, type_data)
 
                     differences = ""
                     if existing_schema != merged_schema:
-                        differences = self.differ.compare(
-                            dict(existing_schema), merged_schema
-                        ).render()
+                        differences = self.differ.compare(existing_schema, merged_schema).render()
                     pytest.fail(f"\n\n{differences}\n\nValidation error in `{name}`: {e.message}")
 
             return name, schema_updated
@@ -16,6 +16,9 @@ from .stats import GLOBAL_STATS, SchemaStats
 # Global storage of SchemaShot instances for different directories
 _schema_managers: Dict[Path, SchemaShot] = {}
 
+# Mutually exclusive run modes, in the order (update, reset, ci/cd)
+_EXCLUSIVE_MODES = ("--schema-update", "--schema-reset", "--jsss-ci-cd")
+
 
 def pytest_addoption(parser: pytest.Parser) -> None:
     """Adds --schema-update option to pytest."""
@@ -96,19 +99,14 @@ def schemashot(request: pytest.FixtureRequest) -> Generator[SchemaShot, None, No
     root_dir = test_path.parent
 
     # Автополучение значения и валидация
-    update_mode: str | bool = "--schema-update"
-    reset_mode: str | bool = "--schema-reset"
-    ci_cd_mode: str | bool = "--jsss-ci-cd"
-
-    modes = [update_mode, reset_mode, ci_cd_mode]
     states: list[bool] = []
     enabled = []
 
-    for mode in modes:
-        state = bool(request.config.getoption(str(mode)))
+    for mode in _EXCLUSIVE_MODES:
+        state = bool(request.config.getoption(mode))
         states.append(state)
         if state:
-            enabled.append(str(mode))
+            enabled.append(mode)
 
     update_mode, reset_mode, ci_cd_mode = states
 
@@ -130,24 +128,24 @@ def schemashot(request: pytest.FixtureRequest) -> Generator[SchemaShot, None, No
     format_mode = str(request.config.getini("jsss_format_mode")).lower()
     # examples_limit = int(request.config.getini("jsss_examples_limit"))
 
-    differ = JsonSchemaDiff(
-        ConfigMaker.make(),
-        HighlighterPipeline(
-            [MonoLinesHighlighter(), PathHighlighter(), ReplaceGenericHighlighter()]
-        ),
-    )
-
     # Создаем или получаем экземпляр SchemaShot для этой директории
     if root_dir not in _schema_managers:
+        # differ нужен только новому экземпляру – не собираем его на каждый тест
+        differ = JsonSchemaDiff(
+            ConfigMaker.make(),
+            HighlighterPipeline(
+                [MonoLinesHighlighter(), PathHighlighter(), ReplaceGenericHighlighter()]
+            ),
+        )
         _schema_managers[root_dir] = SchemaShot(
             root_dir=root_dir,
             differ=differ,
             callable_regex=callable_regex,
             format_mode=format_mode,
             # examples_limit,
-            update_mode=bool(update_mode),
-            reset_mode=bool(reset_mode),
-            ci_cd_mode=bool(ci_cd_mode),
+            update_mode=update_mode,
+            reset_mode=reset_mode,
+            ci_cd_mode=ci_cd_mode,
             update_actions=actions,
             save_original=save_original,
             debug_mode=debug_mode,
@@ -177,14 +175,14 @@ def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter, exitstatu
     """
     Adds a summary about schemas to the final pytest report in the terminal.
     """
-    # Выполняем cleanup перед показом summary
-    if _schema_managers:
 
-        def get_opt(opt: str) -> bool:
-            return bool(terminalreporter.config.getoption(opt))
+    def get_opt(opt: str) -> bool:
+        return bool(terminalreporter.config.getoption(opt))
 
-        update_mode = get_opt("--schema-update")
+    update_mode = get_opt("--schema-update")
 
+    # Выполняем cleanup перед показом summary
+    if _schema_managers:
         actions = {
             "delete": not get_opt("--without-delete"),
             "update": not get_opt("--without-update"),
@@ -196,7 +194,6 @@ def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter, exitstatu
             cleanup_unused_schemas(manager, update_mode, actions, GLOBAL_STATS)
 
     # Используем новую функцию для вывода статистики
-    update_mode = bool(terminalreporter.config.getoption("--schema-update"))
     GLOBAL_STATS.print_summary(terminalreporter, update_mode)
 
 
@@ -219,46 +216,46 @@ def cleanup_unused_schemas(
     if not manager.snapshot_dir.exists():
         return
 
-    # Перебираем все файлы схем
-    all_schemas = list(manager.snapshot_dir.glob("*.schema.json"))
-
-    for schema_file in all_schemas:
-        if schema_file.name not in manager.used_schemas:
-            if update_mode and actions.get("delete"):
-                try:
-                    # Удаляем саму схему
-                    schema_file.unlink()
-                    if stats:
-                        stats.add_deleted(schema_file.name)
-
-                    # Пытаемся удалить парный JSON: <name>.json
-                    # Преобразуем "<name>.schema.json" -> "<name>.json"
-                    base_name = schema_file.name[: -len(".schema.json")]
-                    paired_json = schema_file.with_name(f"{base_name}.json")
-                    if paired_json.exists():
-                        try:
-                            paired_json.unlink()
-                            if stats:
-                                stats.add_deleted(paired_json.name)
-                        except OSError as e:
-                            manager.logger.warning(
-                                f"Failed to delete paired JSON for {schema_file.name}: {e}"
-                            )
-                        except Exception as e:
-                            manager.logger.error(
-                                f"Unexpected error deleting paired JSON for {schema_file.name}: {e}"
-                            )
-
-                except OSError as e:
-                    # Логируем ошибки удаления, но не прерываем работу
-                    manager.logger.warning(
-                        f"Failed to delete unused schema {schema_file.name}: {e}"
-                    )
-                except Exception as e:
-                    # Неожиданные ошибки тоже логируем
-                    manager.logger.error(
-                        f"Unexpected error deleting schema {schema_file.name}: {e}"
-                    )
-            else:
+    # Отбираем только неиспользованные схемы прямо при обходе директории;
+    # список нужен, чтобы не удалять файлы посреди glob
+    unused_schemas = [
+        schema_file
+        for schema_file in manager.snapshot_dir.glob("*.schema.json")
+        if schema_file.name not in manager.used_schemas
+    ]
+
+    for schema_file in unused_schemas:
+        if update_mode and actions.get("delete"):
+            try:
+                # Удаляем саму схему
+                schema_file.unlink()
                 if stats:
-                    stats.add_unused(schema_file.name)
+                    stats.add_deleted(schema_file.name)
+
+                # Пытаемся удалить парный JSON: <name>.json
+                # Преобразуем "<name>.schema.json" -> "<name>.json"
+                base_name = schema_file.name[: -len(".schema.json")]
+                paired_json = schema_file.with_name(f"{base_name}.json")
+                if paired_json.exists():
+                    try:
+                        paired_json.unlink()
+                        if stats:
+                            stats.add_deleted(paired_json.name)
+                    except OSError as e:
+                        manager.logger.warning(
+                            f"Failed to delete paired JSON for {schema_file.name}: {e}"
+                        )
+                    except Exception as e:
+                        manager.logger.error(
+                            f"Unexpected error deleting paired JSON for {schema_file.name}: {e}"
+                        )
+
+            except OSError as e:
+                # Логируем ошибки удаления, но не прерываем работу
+                manager.logger.warning(f"Failed to delete unused schema {schema_file.name}: {e}")
+            except Exception as e:
+                # Неожиданные ошибки тоже логируем
+                manager.logger.error(f"Unexpected error deleting schema {schema_file.name}: {e}")
+        else:
+            if stats:
+                stats.add_unused(schema_file.name)
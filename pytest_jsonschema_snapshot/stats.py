@@ -2,10 +2,25 @@
 Module for collecting and displaying statistics about schemas.
 """
 
-from typing import Dict, Generator, List, Optional
+import re
+from typing import Dict, List, Optional
 
 import pytest
 
+_SCHEMA_SFX = ".schema.json"
+_JSON_SFX = ".json"
+_SCHEMA_CUT = -len(_SCHEMA_SFX)
+_JSON_CUT = -len(_JSON_SFX)
+
+_DIFF_INDENT = " " * 6
+# blank (whitespace-only) lines anywhere in a rendered diff
+_BLANK_LINES = re.compile(r"\A\s*\n|\n\s*(?=\n)|\n\s*\Z")
+
+
+def _indent_diff(diff: str) -> str:
+    """Indents a rendered diff for the summary, dropping blank lines"""
+    return _DIFF_INDENT + _BLANK_LINES.sub("", diff).replace("\n", "\n" + _DIFF_INDENT)
+
 
 class SchemaStats:
     """Class for collecting and displaying statistics about schemas"""
@@ -25,13 +40,10 @@ class SchemaStats:
 
     def add_updated(self, schema_name: str, diff: Optional[str] = None) -> None:
         """Adds updated schema"""
-        # Generate diff if both schemas are provided
+        # Without a diff, still assume it was an update
+        self.updated.append(schema_name)
         if diff and diff.strip():
-            self.updated.append(schema_name)
             self.updated_diffs[schema_name] = diff
-        else:
-            # If schemas are not provided, assume it was an update
-            self.updated.append(schema_name)
 
     def add_uncommitted(self, schema_name: str, diff: Optional[str] = None) -> None:
         """Adds schema with uncommitted changes"""
@@ -61,71 +73,64 @@ class SchemaStats:
         if self.created:
             parts.append(
                 f"Created schemas ({len(self.created)}): "
-                + ", ".join(f"`{s}`" for s in self.created)
+                + ", ".join([f"`{s}`" for s in self.created])
             )
         if self.updated:
             parts.append(
                 f"Updated schemas ({len(self.updated)}): "
-                + ", ".join(f"`{s}`" for s in self.updated)
+                + ", ".join([f"`{s}`" for s in self.updated])
             )
         if self.deleted:
             parts.append(
                 f"Deleted schemas ({len(self.deleted)}): "
-                + ", ".join(f"`{s}`" for s in self.deleted)
+                + ", ".join([f"`{s}`" for s in self.deleted])
             )
         if self.unused:
             parts.append(
-                f"Unused schemas ({len(self.unused)}): " + ", ".join(f"`{s}`" for s in self.unused)
+                f"Unused schemas ({len(self.unused)}): "
+                + ", ".join([f"`{s}`" for s in self.unused])
             )
 
         return "\n".join(parts)
 
-    def _iter_schemas(self, names: List[str]) -> Generator[tuple[str, Optional[str]], None, None]:
-        """
-        Iterates over schema displays: (display, schema_key)
-        - display: string to display (may have " + original")
-        - schema_key: file name of the schema (<name>.schema.json) to find diffs,
-          or None if it's not a schema.
-        Preserves the original list order: merging happens at .schema.json
-        position; skips .json if paired with schema.
+    def _classify(self, names: List[str]) -> tuple[List[tuple[str, str]], List[str]]:
         """
-        names = list(names)  # order matters
-        schema_sfx = ".schema.json"
-        json_sfx = ".json"
-
-        # sets of bases
-        # bases_with_schema = {n[: -len(schema_sfx)] for n in names if n.endswith(schema_sfx)}
-        bases_with_original = {
-            n[: -len(json_sfx)]
-            for n in names
-            if n.endswith(json_sfx) and not n.endswith(schema_sfx)
-        }
+        Splits names into schema displays and unpaired originals in one go.
 
+        Returns (schemas, only_originals):
+        - schemas: list of (display, schema_key) where display may have " + original"
+          and schema_key is the file name of the schema (<name>.schema.json) to find diffs;
+        - only_originals: .json files that have no paired .schema.json.
+        Both lists preserve the original order of names.
+        """
+        # sets of bases, collected in a single scan; each name is suffix-checked once
+        bases_with_schema: set[str] = set()
+        bases_with_original: set[str] = set()
+        parsed: List[tuple[str, str, bool]] = []  # (name, base, is_schema)
         for n in names:
-            if n.endswith(schema_sfx):
-                base = n[: -len(schema_sfx)]
+            if n.endswith(_SCHEMA_SFX):
+                base = n[:_SCHEMA_CUT]
+                bases_with_schema.add(base)
+                parsed.append((n, base, True))
+            elif n.endswith(_JSON_SFX):
+                base = n[:_JSON_CUT]
+                bases_with_original.add(base)
+                parsed.append((n, base, False))
+            # if other, skip (assume all are .json or .schema.json)
+
+        schemas: List[tuple[str, str]] = []
+        only_originals: List[str] = []
+        for n, base, is_schema in parsed:
+            if is_schema:
                 if base in bases_with_original:
-                    yield f"{n} + original", n  # display, schema_key
+                    schemas.append((f"{n} + original", n))  # display, schema_key
                 else:
-                    yield n, n
-            # if .json, skip if paired
-            # if other, yield n, n (but assume all are .json or .schema.json)
+                    schemas.append((n, n))
+            elif base not in bases_with_schema:
+                # if .json, skip if paired
+                only_originals.append(n)
 
-    def _iter_only_originals(self, names: List[str]) -> Generator[str, None, None]:
-        """
-        Iterates over only unpaired .json files, in the order they appear.
-        """
-        names = list(names)  # order matters
-        schema_sfx = ".schema.json"
-        json_sfx = ".json"
-
-        bases_with_schema = {n[: -len(schema_sfx)] for n in names if n.endswith(schema_sfx)}
-
-        for n in names:
-            if n.endswith(json_sfx) and not n.endswith(schema_sfx):
-                base = n[: -len(json_sfx)]
-                if base not in bases_with_schema:
-                    yield n
+        return schemas, only_originals
 
     def print_summary(self, terminalreporter: pytest.TerminalReporter, update_mode: bool) -> None:
         """
@@ -142,8 +147,7 @@ class SchemaStats:
 
         # Created
         if self.created:
-            schemas = list(self._iter_schemas(self.created))
-            only_originals = list(self._iter_only_originals(self.created))
+            schemas, only_originals = self._classify(self.created)
             if schemas:
                 terminalreporter.write_line(f"Created schemas ({len(schemas)}):", green=True)
                 for display, _key in schemas:
@@ -157,20 +161,17 @@ class SchemaStats:
 
         # Updated
         if self.updated:
-            schemas = list(self._iter_schemas(self.updated))
-            only_originals = list(self._iter_only_originals(self.updated))
+            schemas, only_originals = self._classify(self.updated)
             if schemas:
                 terminalreporter.write_line(f"Updated schemas ({len(schemas)}):", yellow=True)
                 for display, key in schemas:
                     terminalreporter.write_line(f"  - {display}", yellow=True)
                     # Show diff if available for schema
-                    if key and key in self.updated_diffs:
-                        diff = self.updated_diffs[key]
+                    diff = self.updated_diffs.get(key)
+                    if diff is not None:
                         if diff.strip():
                             terminalreporter.write_line("    Changes:", yellow=True)
-                            for line in diff.split("\n"):
-                                if line.strip():
-                                    terminalreporter.write_line(f"      {line}")
+                            terminalreporter.write_line(_indent_diff(diff))
                             terminalreporter.write_line("")  # separation
                         else:
                             terminalreporter.write_line(
@@ -188,21 +189,20 @@ class SchemaStats:
             terminalreporter.write_line(
                 f"Uncommitted minor updates ({len(self.uncommitted)}):", bold=True
             )
-            for display, key in self._iter_schemas(self.uncommitted):  # assuming mostly schemas
+            schemas, _only_originals = self._classify(self.uncommitted)
+            for display, key in schemas:  # assuming mostly schemas
                 terminalreporter.write_line(f"  - {display}", cyan=True)
                 # Show diff if available
-                if key and key in self.uncommitted_diffs:
+                diff = self.uncommitted_diffs.get(key)
+                if diff is not None:
                     terminalreporter.write_line("    Detected changes:", cyan=True)
-                    for line in self.uncommitted_diffs[key].split("\n"):
-                        if line.strip():
-                            terminalreporter.write_line(f"      {line}")
+                    terminalreporter.write_line(_indent_diff(diff))
                     terminalreporter.write_line("")  # separation
             terminalreporter.write_line("Use --schema-update to commit these changes", cyan=True)
 
         # Deleted
         if self.deleted:
-            schemas = list(self._iter_schemas(self.deleted))
-            only_originals = list(self._iter_only_originals(self.deleted))
+            schemas, only_originals = self._classify(self.deleted)
             if schemas:
                 terminalreporter.write_line(f"Deleted schemas ({len(schemas)}):", red=True)
                 for display, _key in schemas:
@@ -217,7 +217,8 @@ class SchemaStats:
         # Unused (only if not update_mode)
         if self.unused and not update_mode:
             terminalreporter.write_line(f"Unused schemas ({len(self.unused)}):")
-            for display, _key in self._iter_schemas(self.unused):  # assuming schemas
+            schemas, _only_originals = self._classify(self.unused)
+            for display, _key in schemas:  # assuming schemas
                 terminalreporter.write_line(f"  - {display}")
             terminalreporter.write_line("Use --schema-update to delete unused schemas", yellow=True)
 
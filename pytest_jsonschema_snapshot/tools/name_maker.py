@@ -4,7 +4,7 @@ import inspect
 import re
 import types
 from functools import partial
-from typing import Callable, List, Optional, TypedDict
+from typing import Callable, Dict, List, Optional, TypedDict
 
 # ──────────────────────────── Типы ────────────────────────────
 _Meta = TypedDict(
@@ -19,6 +19,50 @@ _Meta = TypedDict(
 )
 
 
+# ─────────────────────── Плейсхолдеры ─────────────────────────
+def _expand_package(joiner: Optional[str], m: _Meta) -> str:
+    return m["package"]
+
+
+def _expand_package_full(joiner: Optional[str], m: _Meta) -> str:
+    sep = joiner if joiner is not None else "."
+    return sep.join(m["package_full"].split("."))
+
+
+def _expand_path(joiner: Optional[str], m: _Meta) -> str:
+    if not m["path_parts"]:
+        return ""
+    sep = joiner if joiner is not None else "/"
+    return sep.join(m["path_parts"])
+
+
+def _expand_class(joiner: Optional[str], m: _Meta) -> str:
+    return m["class"] or ""
+
+
+def _expand_method(joiner: Optional[str], m: _Meta) -> str:
+    return m["method"]
+
+
+def _expand_class_method(joiner: Optional[str], m: _Meta) -> str:
+    sep = joiner if joiner is not None else "."
+    cls_name = m["class"]
+    if cls_name:
+        return sep.join([cls_name, m["method"]])
+    return m["method"]
+
+
+# placeholder name → expander, one dict hit instead of an if-chain
+_EXPANDERS: Dict[str, Callable[[Optional[str], _Meta], str]] = {
+    "package": _expand_package,
+    "package_full": _expand_package_full,
+    "path": _expand_path,
+    "class": _expand_class,
+    "method": _expand_method,
+    "class_method": _expand_class_method,
+}
+
+
 # ──────────────────────────── Класс ───────────────────────────
 class NameMaker:
     """
@@ -49,6 +93,8 @@ class NameMaker:
     """
 
     _RE_PLHDR = re.compile(r"\{([^{}]+)\}")
+    # one pass for every collapsible separator: runs of '/', '.' or '-'
+    _RE_DUPES = re.compile(r"([/.\-])\1+")
 
     # ───────────────────────────── PUBLIC ──────────────────────────────
     @staticmethod
@@ -59,12 +105,12 @@ class NameMaker:
         meta: _Meta = NameMaker._meta(obj)
 
         def _sub(match: re.Match[str]) -> str:  # noqa: N802
-            token: str | None = match.group(1)
-            name: str = token.split("=", 1)[0] if token else ""
-            joiner: str | None = token.split("=", 1)[1] if token and "=" in token else None
-            return NameMaker._expand(name, joiner, meta)
+            # one partition instead of scanning the token for "=" three times
+            name, eq, joiner = match.group(1).partition("=")
+            return NameMaker._expand(name, joiner if eq else None, meta)
 
-        out = NameMaker._RE_PLHDR.sub(_sub, rule)
+        # a rule without placeholders is taken literally – skip the regex engine
+        out = NameMaker._RE_PLHDR.sub(_sub, rule) if "{" in rule else rule
         return NameMaker._collapse(out)
 
     # ──────────────────────────── INTERNAL ────────────────────────────
@@ -120,34 +166,15 @@ class NameMaker:
     # placeholders ------------------------------------------------------
     @staticmethod
     def _expand(name: str, joiner: Optional[str], m: _Meta) -> str:
-        if name == "package":
-            return m["package"]
-        if name == "package_full":
-            sep = joiner if joiner is not None else "."
-            return sep.join(m["package_full"].split("."))
-        if name == "path":
-            if not m["path_parts"]:
-                return ""
-            sep = joiner if joiner is not None else "/"
-            return sep.join(m["path_parts"])
-        if name == "class":
-            return m["class"] or ""
-        if name == "method":
-            return m["method"]
-        if name == "class_method":
-            sep = joiner if joiner is not None else "."
-            cls_name = m["class"]
-            if cls_name:
-                return sep.join([cls_name, m["method"]])
-            return m["method"]
+        expander = _EXPANDERS.get(name)
         # unknown placeholder → empty
-        return ""
+        return expander(joiner, m) if expander is not None else ""
 
     # post-processing ---------------------------------------------------
     @staticmethod
     def _collapse(s: str) -> str:
-        # collapse critical duplicates but keep double underscores
-        s = re.sub(r"/{2,}", "/", s)  # '//' → '/'
-        s = re.sub(r"\.{2,}", ".", s)  # '..' → '.'
-        s = re.sub(r"-{2,}", "-", s)  # '--' → '-'
-        return s
+        # collapse critical duplicates but keep double underscores:
+        # '//' → '/', '..' → '.', '--' → '-'
+        if "//" not in s and ".." not in s and "--" not in s:
+            return s  # nothing to collapse (the common case)
+        return NameMaker._RE_DUPES.sub(r"\1", s)
@@ -1,5 +1,8 @@
+import json
 from pathlib import Path
 
+import pytest
+from jsonschema import Draft202012Validator, ValidationError
 from jsonschema_diff import ConfigMaker, JsonSchemaDiff
 from jsonschema_diff.color import HighlighterPipeline
 from jsonschema_diff.color.stages import (
@@ -44,3 +47,56 @@ def test_constructor_recreates_cicd_dir_when_enabled(tmp_path: Path) -> None:
 
     assert cicd.exists()
     assert list(cicd.iterdir()) == []
+
+
+def test_process_name_validates_each_name_once(tmp_path: Path, monkeypatch) -> None:
+    calls: list[str] = []
+    original = core_module.pathvalidate.validate_filename
+
+    def counting_validate(name, *args, **kwargs):
+        calls.append(name)
+        return original(name, *args, **kwargs)
+
+    monkeypatch.setattr(core_module.pathvalidate, "validate_filename", counting_validate)
+
+    shot = SchemaShot(root_dir=tmp_path, differ=make_differ())
+
+    assert shot._process_name(["a", 1]) == "a.1"
+    assert shot._process_name("a.1") == "a.1"
+    assert calls == ["a.1"]
+
+
+def test_logger_handler_is_attached_once(tmp_path: Path) -> None:
+    first = SchemaShot(root_dir=tmp_path / "a", differ=make_differ())
+    second = SchemaShot(root_dir=tmp_path / "b", differ=make_differ())
+
+    assert first.logger is second.logger
+    assert len(second.logger.handlers) == 1
+
+
+def test_validator_is_checked_once_per_snapshot(tmp_path: Path, monkeypatch) -> None:
+    checks: list[dict] = []
+    original = Draft202012Validator.check_schema
+
+    def counting_check(schema, *args, **kwargs):
+        checks.append(schema)
+        return original(schema, *args, **kwargs)
+
+    monkeypatch.setattr(Draft202012Validator, "check_schema", counting_check)
+
+    shot = SchemaShot(root_dir=tmp_path, differ=make_differ())
+    path = tmp_path / "a.schema.json"
+    text = '{"$schema": "https://json-schema.org/draft/2020-12/schema", "type": "integer"}'
+    schema = json.loads(text)
+
+    shot._validate_instance(1, path, text, schema)
+    shot._validate_instance(2, path, text, schema)
+    with pytest.raises(ValidationError):
+        shot._validate_instance("x", path, text, schema)
+    assert len(checks) == 1
+
+    # a changed snapshot replaces the cached entry instead of adding one
+    text = '{"$schema": "https://json-schema.org/draft/2020-12/schema", "type": "string"}'
+    shot._validate_instance("x", path, text, json.loads(text))
+    assert len(checks) == 2
+    assert len(shot._validators) == 1
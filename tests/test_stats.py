@@ -100,3 +100,29 @@ def test_print_summary_hides_unused_in_update_mode():
     output = "\n".join(fake.lines)
 
     assert "Unused schemas".lower() not in output.lower()
+
+
+def test_classify_pairs_schemas_with_originals_in_one_pass():
+    """_classify должен сохранять порядок и отделять непарные .json."""
+    s = SchemaStats()
+    schemas, only_originals = s._classify(
+        ["a.json", "a.schema.json", "b.schema.json", "c.json", "d.schema.json", "d.json"]
+    )
+
+    assert schemas == [
+        ("a.schema.json + original", "a.schema.json"),
+        ("b.schema.json", "b.schema.json"),
+        ("d.schema.json + original", "d.schema.json"),
+    ]
+    assert only_originals == ["c.json"]
+
+
+def test_print_summary_indents_diff_and_drops_blank_lines():
+    """Diff выводится с отступом одним блоком, пустые строки отбрасываются."""
+    s = SchemaStats()
+    s.add_uncommitted("minor.schema.json", diff="\n+ first\n\n   \n  - second\n")
+
+    fake = FakeTerminalReporter()
+    s.print_summary(fake, update_mode=False)
+
+    assert "      + first\n        - second\n" in "\n".join(fake.lines)
@@ -210,6 +210,12 @@ def test_double_slashes_from_literal_collapsed():
     assert got == "X/C/m/Y"
 
 
+def test_mixed_separator_runs_collapsed_independently():
+    # каждая серия '/', '.', '-' схлопывается отдельно, '__' остаётся
+    got = NameMaker.format(K(), "a...b---c//{class_method=.}")
+    assert got == "a.b-c/K.__call__"
+
+
 def test_unknown_placeholder_becomes_empty():
     got = NameMaker.format(free_func, "A{unknown}B")
     assert got == "AB"